@@ -0,0 +1,246 @@
+/*
+ * Native walker for compiled path expressions (see paths.compile_path).
+ *
+ * walk(data, opcodes, keys) resolves one path against `data`. `opcodes` is a
+ * bytes object with one opcode per path token and `keys` a tuple of the
+ * token keys:
+ *
+ *   DICT_STEP       descend into data[key] when data is a dict holding key
+ *   LIST_STAR_STEP  same, then visit every item when the value is a list
+ *
+ * The result matches the pure-Python resolver exactly: a list of
+ * (loc_tuple, value) pairs in document order. Location tuples are built once
+ * per match from a segment stack instead of being grown at every step.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+enum {
+    DICT_STEP = 0,
+    LIST_STAR_STEP = 1,
+};
+
+typedef struct {
+    const char *opcodes;
+    PyObject *keys;      /* tuple of str, borrowed */
+    Py_ssize_t n_ops;
+    PyObject **segments; /* loc stack: borrowed keys and owned index strings */
+    Py_ssize_t depth;
+    PyObject *results;   /* list of (loc, value) */
+} WalkState;
+
+static int walk_from(WalkState *state, PyObject *current, Py_ssize_t pos);
+
+static int
+emit(WalkState *state, PyObject *value)
+{
+    PyObject *loc = PyTuple_New(state->depth);
+    if (loc == NULL) {
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < state->depth; i++) {
+        Py_INCREF(state->segments[i]);
+        PyTuple_SET_ITEM(loc, i, state->segments[i]);
+    }
+    PyObject *pair = PyTuple_Pack(2, loc, value);
+    Py_DECREF(loc);
+    if (pair == NULL) {
+        return -1;
+    }
+    int rc = PyList_Append(state->results, pair);
+    Py_DECREF(pair);
+    return rc;
+}
+
+/* 1 and a new reference in *out when found, 0 when missing, -1 on error. */
+static int
+lookup(PyObject *current, PyObject *key, PyObject **out)
+{
+    if (PyDict_CheckExact(current)) {
+        PyObject *value = PyDict_GetItemWithError(current, key);
+        if (value == NULL) {
+            return PyErr_Occurred() ? -1 : 0;
+        }
+        Py_INCREF(value);
+        *out = value;
+        return 1;
+    }
+    if (!PyDict_Check(current)) {
+        return 0;
+    }
+    /* dict subclasses may override __contains__/__getitem__. */
+    int has_key = PySequence_Contains(current, key);
+    if (has_key <= 0) {
+        return has_key;
+    }
+    *out = PyObject_GetItem(current, key);
+    return *out == NULL ? -1 : 1;
+}
+
+static int
+visit_item(WalkState *state, PyObject *item, Py_ssize_t idx, Py_ssize_t pos)
+{
+    PyObject *segment = PyUnicode_FromFormat("%zd", idx);
+    if (segment == NULL) {
+        return -1;
+    }
+    state->segments[state->depth++] = segment;
+    int rc = walk_from(state, item, pos);
+    state->depth--;
+    Py_DECREF(segment);
+    return rc;
+}
+
+static int
+walk_items(WalkState *state, PyObject *list, Py_ssize_t pos)
+{
+    if (PyList_CheckExact(list)) {
+        for (Py_ssize_t idx = 0; idx < PyList_GET_SIZE(list); idx++) {
+            PyObject *item = PyList_GET_ITEM(list, idx);
+            Py_INCREF(item);
+            int rc = visit_item(state, item, idx, pos);
+            Py_DECREF(item);
+            if (rc < 0) {
+                return -1;
+            }
+        }
+        return 0;
+    }
+
+    /* list subclasses may override __iter__, which enumerate() honours. */
+    PyObject *iterator = PyObject_GetIter(list);
+    if (iterator == NULL) {
+        return -1;
+    }
+    PyObject *item;
+    Py_ssize_t idx = 0;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        int rc = visit_item(state, item, idx++, pos);
+        Py_DECREF(item);
+        if (rc < 0) {
+            Py_DECREF(iterator);
+            return -1;
+        }
+    }
+    Py_DECREF(iterator);
+    return PyErr_Occurred() ? -1 : 0;
+}
+
+static int
+walk_from(WalkState *state, PyObject *current, Py_ssize_t pos)
+{
+    if (pos == state->n_ops) {
+        return emit(state, current);
+    }
+
+    PyObject *key = PyTuple_GET_ITEM(state->keys, pos);
+    PyObject *value;
+    int found = lookup(current, key, &value);
+    if (found <= 0) {
+        return found;
+    }
+
+    int rc = 0;
+    state->segments[state->depth++] = key;
+    if (state->opcodes[pos] == DICT_STEP) {
+        rc = walk_from(state, value, pos + 1);
+    }
+    else if (PyList_Check(value)) {
+        rc = walk_items(state, value, pos + 1);
+    }
+    state->depth--;
+    Py_DECREF(value);
+    return rc;
+}
+
+static PyObject *
+paths_walk(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 3) {
+        PyErr_Format(PyExc_TypeError, "walk() takes exactly 3 arguments (%zd given)", nargs);
+        return NULL;
+    }
+    PyObject *data = args[0];
+    PyObject *opcodes = args[1];
+    PyObject *keys = args[2];
+    if (!PyBytes_Check(opcodes) || !PyTuple_Check(keys)) {
+        PyErr_SetString(PyExc_TypeError, "walk() expects (data, bytes opcodes, tuple keys)");
+        return NULL;
+    }
+
+    Py_ssize_t n_ops = PyBytes_GET_SIZE(opcodes);
+    if (PyTuple_GET_SIZE(keys) != n_ops) {
+        PyErr_SetString(PyExc_ValueError, "walk() needs one key per opcode");
+        return NULL;
+    }
+    const char *codes = PyBytes_AS_STRING(opcodes);
+    for (Py_ssize_t i = 0; i < n_ops; i++) {
+        if (codes[i] != DICT_STEP && codes[i] != LIST_STAR_STEP) {
+            PyErr_Format(PyExc_ValueError, "unknown opcode %d", (int)codes[i]);
+            return NULL;
+        }
+        if (!PyUnicode_Check(PyTuple_GET_ITEM(keys, i))) {
+            PyErr_SetString(PyExc_TypeError, "walk() keys must be str");
+            return NULL;
+        }
+    }
+
+    WalkState state;
+    state.opcodes = codes;
+    state.keys = keys;
+    state.n_ops = n_ops;
+    state.depth = 0;
+    /* Every step pushes its key; list steps also push an index. */
+    state.segments = PyMem_New(PyObject *, 2 * n_ops + 1);
+    if (state.segments == NULL) {
+        return PyErr_NoMemory();
+    }
+    state.results = PyList_New(0);
+    if (state.results == NULL) {
+        PyMem_Free(state.segments);
+        return NULL;
+    }
+
+    int rc = walk_from(&state, data, 0);
+    PyMem_Free(state.segments);
+    if (rc < 0) {
+        Py_CLEAR(state.results);
+    }
+    return state.results;
+}
+
+static PyMethodDef paths_methods[] = {
+    {"walk", (PyCFunction)(void (*)(void))paths_walk, METH_FASTCALL,
+     "walk(data, opcodes, keys) -> list of (loc, value) pairs"},
+    {NULL, NULL, 0, NULL},
+};
+
+static int
+paths_exec(PyObject *module)
+{
+    if (PyModule_AddIntConstant(module, "DICT_STEP", DICT_STEP) < 0) {
+        return -1;
+    }
+    return PyModule_AddIntConstant(module, "LIST_STAR_STEP", LIST_STAR_STEP);
+}
+
+static PyModuleDef_Slot paths_slots[] = {
+    {Py_mod_exec, paths_exec},
+    {0, NULL},
+};
+
+static struct PyModuleDef paths_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "fast_validation._paths",
+    .m_doc = "Native walker for compiled path expressions.",
+    .m_size = 0,
+    .m_methods = paths_methods,
+    .m_slots = paths_slots,
+};
+
+PyMODINIT_FUNC
+PyInit__paths(void)
+{
+    return PyModuleDef_Init(&paths_module);
+}
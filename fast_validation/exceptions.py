@@ -10,6 +10,8 @@ class ValidationRuleException(ValueError):
     Separate from Pydantic's ValidationError to distinguish post-parse rule failures.
     """
 
+    __slots__ = ("message", "loc", "error_type", "errors")
+
     def __init__(
         self,
         message: str,
@@ -24,6 +26,17 @@ class ValidationRuleException(ValueError):
         self.error_type: str = error_type
         self.errors: list[dict[str, Any]] | None = errors
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException pickles args and __dict__ only; carry the slots too.
+        state = dict(self.__dict__)
+        state.update(
+            message=self.message,
+            loc=self.loc,
+            error_type=self.error_type,
+            errors=self.errors,
+        )
+        return type(self), self.args, state
+
 
 class ValidationNotRunException(AttributeError):
     """
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import copy
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, get_args, get_origin
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic.fields import FieldInfo
 
@@ -9,7 +24,8 @@ from .schema import Schema
 
 SchemaType = TypeVar("SchemaType", bound="Schema")
 _MISSING = object()
-_SKIPPED_NAMESPACE_ATTRS = {
+_OPTIONAL_ANY = Optional[Any]
+_SKIPPED_NAMESPACE_ATTRS = frozenset({
     "__dict__",
     "__weakref__",
     "__annotations__",
@@ -19,7 +35,14 @@ _SKIPPED_NAMESPACE_ATTRS = {
     "__abstractmethods__",
     "Meta",
     "_abc_impl",
-}
+})
+# Derived schemas keyed by everything that shapes them; see _derived_cache_key.
+_DERIVED_CACHE_SIZE = 256
+_derived_cache: "OrderedDict[Hashable, type]" = OrderedDict()
+_ATOMIC_TYPES = frozenset({str, bytes, int, bool, type(None)})
+_FIELD_INFO_SLOTS = tuple(
+    name for klass in FieldInfo.__mro__ for name in getattr(klass, "__slots__", ())
+)
 
 
 def from_schema(
@@ -33,6 +56,9 @@ def from_schema(
     The decorated class can override fields or metadata while inheriting
     everything else from ``base_schema``. When ``partial`` is True,
     any field not explicitly overridden becomes optional.
+
+    Identical declarations (e.g. a decorated class inside a factory that is
+    called repeatedly) reuse the first derived class instead of rebuilding it.
     """
 
     if not isinstance(base_schema, type) or not issubclass(base_schema, Schema):
@@ -42,11 +68,21 @@ def from_schema(
         if not isinstance(target_cls, type):
             raise TypeError("@from_schema can only decorate classes")
 
-        return _build_schema_from_base(
+        key = _derived_cache_key(base_schema, target_cls, partial)
+        if key is not None and key in _derived_cache:
+            _derived_cache.move_to_end(key)
+            return _derived_cache[key]  # type: ignore[return-value]
+
+        derived = _build_schema_from_base(
             base_schema=base_schema,
             target_cls=target_cls,
             make_partial=partial,
         )
+        if key is not None:
+            _derived_cache[key] = derived
+            if len(_derived_cache) > _DERIVED_CACHE_SIZE:
+                _derived_cache.popitem(last=False)
+        return derived
 
     return decorator
 
@@ -58,41 +94,24 @@ def _build_schema_from_base(
     make_partial: bool,
 ) -> Type[SchemaType]:
     base_fields = getattr(base_schema, "model_fields", {}) or {}
-    target_annotations: Dict[str, Any] = dict(getattr(target_cls, "__annotations__", {}))
+    # Target annotations come first and override base fields of the same name.
+    annotations: Dict[str, Any] = dict(getattr(target_cls, "__annotations__", {}))
     namespace: Dict[str, Any] = {
         "__module__": target_cls.__module__,
         "__doc__": target_cls.__doc__,
     }
+    namespace.update(
+        (key, value)
+        for key, value in target_cls.__dict__.items()
+        if key in annotations or not _should_skip_namespace_attr(key)
+    )
+    for field_name, annotation, field_info in _inherited_fields(
+        base_fields, frozenset(annotations), make_partial
+    ):
+        annotations[field_name] = annotation
+        namespace[field_name] = field_info
 
-    for key, value in target_cls.__dict__.items():
-        if _should_skip_namespace_attr(key):
-            continue
-        namespace[key] = value
-
-    combined_annotations: Dict[str, Any] = dict(target_annotations)
-
-    for field_name, field_info in base_fields.items():
-        if field_name in target_annotations:
-            continue
-
-        annotation = field_info.annotation or Any
-        should_optionalize = make_partial and field_info.is_required()
-        if should_optionalize:
-            annotation = _optionalize(annotation)
-
-        combined_annotations[field_name] = annotation
-        namespace[field_name] = _copy_field_info(
-            field_info=field_info,
-            force_optional=should_optionalize,
-        )
-
-    for field_name, annotation in target_annotations.items():
-        combined_annotations[field_name] = annotation
-        attr_value = target_cls.__dict__.get(field_name, _MISSING)
-        if attr_value is not _MISSING:
-            namespace[field_name] = attr_value
-
-    namespace["__annotations__"] = combined_annotations
+    namespace["__annotations__"] = annotations
     meta = _compose_meta(
         target_meta=target_cls.__dict__.get("Meta"),
         base_meta=getattr(base_schema, "Meta", None),
@@ -112,38 +131,151 @@ def _build_schema_from_base(
     # Without this, copied internals from the decorator target can leave the
     # derived model with an empty core schema (input gets ignored as extra).
     derived.model_rebuild(force=True)
+    # Meta was swapped after class creation; refresh the precomputed rule data.
+    derived._prepare_validation()
     return derived
 
 
+def _inherited_fields(
+    base_fields: Dict[str, FieldInfo],
+    overridden: frozenset[str],
+    make_partial: bool,
+) -> Iterator[Tuple[str, Any, FieldInfo]]:
+    """Yield ``(name, annotation, field_info)`` for base fields the target keeps."""
+    for field_name, field_info in base_fields.items():
+        if field_name in overridden:
+            continue
+        annotation = field_info.annotation or Any
+        should_optionalize = make_partial and field_info.is_required()
+        if should_optionalize:
+            annotation = _optionalize(annotation)
+        yield field_name, annotation, _copy_field_info(
+            field_info=field_info,
+            force_optional=should_optionalize,
+        )
+
+
+def _derived_cache_key(
+    base_schema: type,
+    target_cls: type,
+    make_partial: bool,
+) -> Optional[Hashable]:
+    """
+    Build a key identifying the schema ``from_schema`` would derive.
+
+    Values are keyed by ``_value_key``, so equal-but-different values such
+    as ``1``/``True`` or ``0.0``/``-0.0`` never share a derived class.
+    String annotations are keyed as-is: the derived class resolves them
+    against the module globals, and the module is part of the key.
+    Returns ``None`` when some attribute is unhashable.
+    """
+    annotations = getattr(target_cls, "__annotations__", {})
+    try:
+        key: Tuple[Any, ...] = (
+            base_schema,
+            getattr(base_schema, "Meta", None),
+            make_partial,
+            target_cls.__module__,
+            target_cls.__qualname__,
+            target_cls.__doc__,
+            target_cls.__bases__,
+            target_cls.__dict__.get("Meta"),
+            tuple((name, _value_key(value)) for name, value in annotations.items()),
+            tuple(
+                (name, _value_key(value))
+                for name, value in target_cls.__dict__.items()
+                if not _should_skip_namespace_attr(name)
+            ),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _value_key(value: Any) -> Hashable:
+    """
+    Key ``value`` so that equal keys mean interchangeable declarations.
+
+    Atomic immutables are tagged with their exact type (floats by ``repr``,
+    which tells ``-0.0`` from ``0.0``); tuples, frozensets and typing
+    constructs are keyed element-wise. Everything else, including values
+    like ``Decimal("1.0")`` whose equality ignores differences that matter,
+    is keyed by identity.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value_type, value
+    if value_type is float:
+        return float, repr(value)
+    if isinstance(value, type):
+        return value
+    if value_type is tuple:
+        return tuple, tuple(_value_key(item) for item in value)
+    if value_type is frozenset:
+        return frozenset, frozenset(_value_key(item) for item in value)
+    origin = get_origin(value)
+    if origin is not None:
+        return _value_key(origin), tuple(_value_key(arg) for arg in get_args(value))
+    return _Identity(value)
+
+
+class _Identity:
+    """Hashable wrapper comparing the wrapped object by identity."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
 def _compose_meta(target_meta: Optional[type], base_meta: Optional[type]) -> type:
     if target_meta and base_meta and base_meta not in target_meta.__mro__:
         return type("Meta", (target_meta, base_meta), {})
     return target_meta or base_meta or type("Meta", (), {})  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=1024)
 def _optionalize(annotation: Any) -> Any:
     if annotation is Any:
-        return Optional[Any]
-
-    origin = get_origin(annotation)
-    if origin is None:
-        return Optional[annotation]
-
-    args = get_args(annotation)
-    if args and type(None) in args:
-        return annotation
-
-    return Optional[annotation]
+        return _OPTIONAL_ANY
+    # Union flattens nested unions and drops a repeated None, so annotations
+    # that already accept None come back equivalent without inspecting them.
+    return Union[annotation, None]
 
 
 def _copy_field_info(*, field_info: FieldInfo, force_optional: bool) -> FieldInfo:
-    clone = copy(field_info)
+    clone = _clone_field_info(field_info)
     if force_optional and clone.is_required():
         clone.default = None
         clone.default_factory = None
     return clone
 
 
+def _clone_field_info(field_info: FieldInfo) -> FieldInfo:
+    """
+    Shallow copy of ``field_info``, equivalent to ``copy(field_info)``.
+
+    ``FieldInfo`` keeps its state in slots, so copying them directly skips
+    the ``__reduce_ex__`` round trip ``copy`` takes. Subclasses may add a
+    ``__dict__`` or custom copy hooks and keep using ``copy``.
+    """
+    if type(field_info) is not FieldInfo:
+        return copy(field_info)
+    clone = FieldInfo.__new__(FieldInfo)
+    for name in _FIELD_INFO_SLOTS:
+        value = getattr(field_info, name, _MISSING)
+        if value is not _MISSING:
+            setattr(clone, name, value)
+    return clone
+
+
 def _should_skip_namespace_attr(key: str) -> bool:
     if key in _SKIPPED_NAMESPACE_ATTRS:
         return True
@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from ._paths import walk as _native_walk
+except ImportError:  # extension not built; the pure-Python steps are used
+    _native_walk = None
+
+Match = Tuple[Tuple[str, ...], Any]
+PathResolver = Callable[[Any], List[Match]]
+_Step = Callable[[Any, Tuple[str, ...], List[Match]], None]
+
+# Opcodes understood by the native walker (fast_validation/_paths.c).
+DICT_STEP = 0
+LIST_STAR_STEP = 1
+
+# str(idx) for the list indexes in location tuples; most lists are short.
+_SMALL_INT_COUNT = 1024
+_SMALL_INT_STRS = tuple(str(i) for i in range(_SMALL_INT_COUNT))
 
 
 def resolve_path_expressions(data: Any, path_expr: str) -> List[Tuple[Tuple[str, ...], Any]]:
@@ -16,30 +34,203 @@ def resolve_path_expressions(data: Any, path_expr: str) -> List[Tuple[Tuple[str,
     Returns list of (loc_tuple, value) pairs.
     Missing paths return an empty list.
     """
+    return compile_path(path_expr)(data)
+
+
+def path_root(path_expr: str) -> Optional[str]:
+    """
+    Return the top-level key a path expression starts from.
+
+    ``None`` means the expression targets the whole payload (``$``).
+    """
+    tokens = _split_tokens(path_expr)
+    if not tokens:
+        return None
+    return tokens[0].removesuffix("[*]")
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path_expr: str) -> PathResolver:
+    """
+    Compile a path expression into a reusable resolver.
+
+    The expression is parsed once, so resolving it against data does no
+    string work at all. When the ``_paths`` extension is built the walk runs
+    in C; otherwise it is a chain of per-segment Python steps. Either way
+    the returned callable behaves exactly like ``resolve_path_expressions``.
+    """
     if not path_expr.startswith("$"):
         raise ValueError(f"Path must start with '$': {path_expr}")
 
-    tokens: List[str] = [part for part in path_expr.split(".") if part != "$"]
-    results: List[Tuple[Tuple[str, ...], Any]] = [(tuple(), data)]
+    tokens = _split_tokens(path_expr)
+    if _native_walk is not None:
+        return _compile_native(tokens)
+    return _compile_python(tokens)
+
+
+class PathTrie:
+    """
+    Resolve several path expressions in one walk over the data.
+
+    Expressions sharing a prefix (``$.items[*].price`` and ``$.items[*].qty``)
+    walk that prefix once. ``resolve`` returns one match list per expression,
+    in the order given, each equal to what ``compile_path`` would return.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, path_exprs: Sequence[str]) -> None:
+        self._root = _TrieNode("", False)
+        self._size = len(path_exprs)
+        for index, path_expr in enumerate(path_exprs):
+            if not path_expr.startswith("$"):
+                raise ValueError(f"Path must start with '$': {path_expr}")
+            node = self._root
+            for token in _split_tokens(path_expr):
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = _TrieNode(
+                        token.removesuffix("[*]"),
+                        token.endswith("[*]"),
+                    )
+                node = child
+            node.terminals.append(index)
+
+    @property
+    def shares_prefix(self) -> bool:
+        """Whether any expressions share a step, i.e. the trie saves work."""
+        stack = list(self._root.children.values())
+        while stack:
+            node = stack.pop()
+            if len(node.children) + len(node.terminals) > 1:
+                return True
+            stack.extend(node.children.values())
+        return False
+
+    def resolve(self, data: Any) -> List[List[Match]]:
+        results: List[List[Match]] = [[] for _ in range(self._size)]
+        _walk_trie(self._root, data, tuple(), results)
+        return results
+
 
+class _TrieNode:
+    __slots__ = ("key", "is_list_star", "children", "terminals")
+
+    def __init__(self, key: str, is_list_star: bool) -> None:
+        self.key = key
+        self.is_list_star = is_list_star
+        self.children: Dict[str, _TrieNode] = {}
+        self.terminals: List[int] = []
+
+
+def _walk_trie(
+    node: _TrieNode,
+    current: Any,
+    loc: Tuple[str, ...],
+    results: List[List[Match]],
+) -> None:
+    for index in node.terminals:
+        results[index].append((loc, current))
+    if not node.children or not isinstance(current, dict):
+        return
+    for child in node.children.values():
+        key = child.key
+        if key not in current:
+            continue
+        value = current[key]
+        if not child.is_list_star:
+            _walk_trie(child, value, loc + (key,), results)
+        elif isinstance(value, list):
+            base = loc + (key,)
+            for idx, item in enumerate(value):
+                segment = _SMALL_INT_STRS[idx] if idx < _SMALL_INT_COUNT else str(idx)
+                _walk_trie(child, item, base + (segment,), results)
+
+
+def _split_tokens(path_expr: str) -> List[str]:
+    return [part for part in path_expr.split(".") if part != "$"]
+
+
+def _compile_native(tokens: List[str]) -> PathResolver:
+    opcodes = bytes(
+        LIST_STAR_STEP if token.endswith("[*]") else DICT_STEP for token in tokens
+    )
+    keys = tuple(token.removesuffix("[*]") for token in tokens)
+    walk = _native_walk
+
+    def resolve(data: Any) -> List[Match]:
+        return walk(data, opcodes, keys)
+
+    return resolve
+
+
+def _compile_python(tokens: List[str]) -> PathResolver:
+    # Fold each run of plain keys (plus a trailing "[*]" key) into one step, so
+    # the location tuple grows once per run instead of once per key.
+    segments: List[Tuple[Tuple[str, ...], bool]] = []
+    pending: List[str] = []
     for token in tokens:
-        next_results: List[Tuple[Tuple[str, ...], Any]] = []
         if token.endswith("[*]"):
-            key = token[:-3]
-            for loc, current in results:
-                if not isinstance(current, dict) or key not in current:
-                    continue
-                value = current[key]
-                if isinstance(value, list):
-                    for idx, item in enumerate(value):
-                        next_results.append((loc + (key, str(idx)), item))
+            pending.append(token.removesuffix("[*]"))
+            segments.append((tuple(pending), True))
+            pending = []
+        else:
+            pending.append(token)
+    if pending:
+        segments.append((tuple(pending), False))
+
+    step: _Step = _emit_step
+    for keys, is_list_star in reversed(segments):
+        if is_list_star:
+            step = _list_star_step(keys, step)
+        elif len(keys) == 1:
+            step = _dict_step(keys[0], step)
         else:
-            key = token
-            for loc, current in results:
-                if isinstance(current, dict) and key in current:
-                    next_results.append((loc + (key,), current[key]))
-        results = next_results
+            step = _dict_path_step(keys, step)
+
+    def resolve(data: Any) -> List[Match]:
+        results: List[Match] = []
+        step(data, tuple(), results)
+        return results
+
+    return resolve
+
+
+def _emit_step(current: Any, loc: Tuple[str, ...], results: List[Match]) -> None:
+    results.append((loc, current))
+
+
+def _dict_step(key: str, next_step: _Step) -> _Step:
+    single: Tuple[str, ...] = (key,)
+
+    def step(current: Any, loc: Tuple[str, ...], results: List[Match]) -> None:
+        if isinstance(current, dict) and key in current:
+            next_step(current[key], loc + single if loc else single, results)
+
+    return step
+
+
+def _dict_path_step(keys: Tuple[str, ...], next_step: _Step) -> _Step:
+    def step(current: Any, loc: Tuple[str, ...], results: List[Match]) -> None:
+        for key in keys:
+            if not isinstance(current, dict) or key not in current:
+                return
+            current = current[key]
+        next_step(current, loc + keys if loc else keys, results)
+
+    return step
 
-    return results
 
+def _list_star_step(keys: Tuple[str, ...], next_step: _Step) -> _Step:
+    def step(current: Any, loc: Tuple[str, ...], results: List[Match]) -> None:
+        for key in keys:
+            if not isinstance(current, dict) or key not in current:
+                return
+            current = current[key]
+        if isinstance(current, list):
+            base = loc + keys if loc else keys
+            for idx, item in enumerate(current):
+                segment = _SMALL_INT_STRS[idx] if idx < _SMALL_INT_COUNT else str(idx)
+                next_step(item, base + (segment,), results)
 
+    return step
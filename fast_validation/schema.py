@@ -1,13 +1,46 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, List, Mapping, Tuple
+import asyncio
+from collections import abc, deque
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
 
+import annotated_types
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from .exceptions import ValidationNotRunException, ValidationRuleException
-from .paths import resolve_path_expressions
+from .paths import _SMALL_INT_COUNT, _SMALL_INT_STRS, PathTrie, compile_path, path_root
 from .validation_rule import ValidatorRule
 
+_LEAF_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+# Types pydantic dumps (python mode) as the stored value itself.
+_SCALAR_TYPES = frozenset(
+    {str, int, float, bool, bytes, type(None), Decimal, date, datetime, time, timedelta, UUID}
+)
+# Field metadata that only constrains validation and never changes the dump.
+_CONSTRAINT_METADATA = (annotated_types.BaseMetadata, annotated_types.GroupedMetadata)
+# Location of a nested schema as a linked list of (parent, segment) pairs, so
+# walking a container never copies the prefix; see _flatten_loc.
+_LocChain = Union[Tuple["_LocChain", str], None]
+
 
 class Schema(BaseModel):
     """
@@ -16,16 +49,47 @@ class Schema(BaseModel):
 
     _validated: dict[str, Any] | None = PrivateAttr(default=None)
 
+    __fv_has_rules__: ClassVar[bool] = False
+    # (field_name, kind) for every field that may hold a nested Schema
+    __fv_nested_fields__: ClassVar[Tuple[Tuple[str, str], ...]] = ()
+    # whether this class and every nested schema it declares only has sync rules
+    __fv_sync__: ClassVar[bool] = True
+    # top-level keys rule paths start from; None when a rule targets all of "$"
+    __fv_rule_roots__: ClassVar[frozenset[str] | None] = frozenset()
+    # field names when every field dumps to its stored value, else None
+    __fv_scalar_fields__: ClassVar[Tuple[str, ...] | None] = ()
+    # (field name, nested Schema class or None) when every field dumps to its
+    # stored value or to a nested schema's own _dump, else None
+    __fv_dump_plan__: ClassVar[Tuple[Tuple[str, "type[Schema] | None"], ...] | None] = ()
+    __fv_concurrent_nested__: ClassVar[bool] = False
+    __fv_has_nested_schemas__: ClassVar[bool] = False
+    # Meta.rules normalized once at class creation
+    __fv_rules__: ClassVar[Tuple["Schema.Rule", ...]] = ()
+    # one shared-prefix walk for all rules, or None when no paths overlap
+    __fv_rule_trie__: ClassVar["_RuleTrie | None"] = None
+
     class Rule:  # Simple container for rule path and its validators
+        __slots__ = ("path", "validators", "_resolver", "_root", "_all_sync")
+
         def __init__(self, path: str, validators: List[ValidatorRule]) -> None:
             self.path = path
             self.validators = validators
+            self._resolver = compile_path(path)
+            self._root = path_root(path)
+            self._all_sync = all(validator.is_sync for validator in validators)
+
+        def __reduce__(self) -> Tuple[Any, ...]:
+            # The compiled resolver is a closure; recompile it on unpickling.
+            return type(self), (self.path, self.validators)
 
     class Meta:  # Override in subclasses
         rules: (
             List["Schema.Rule"]
             | Mapping[str, ValidatorRule | List[ValidatorRule] | Tuple[ValidatorRule, ...]]
         ) = []
+        # Validate sibling nested schemas concurrently with asyncio.gather.
+        # Worth it when their validators do I/O; adds task overhead otherwise.
+        concurrent_nested: bool = False
 
     model_config = ConfigDict(
         str_strip_whitespace = True,
@@ -36,33 +100,199 @@ class Schema(BaseModel):
         arbitrary_types_allowed = True,  # whether arbitrary types are allowed in models
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._prepare_validation()
+
+    @classmethod
+    def _prepare_validation(cls) -> None:
+        """
+        Precompute per-class validation metadata from ``Meta`` and the model fields.
+
+        Called on subclass creation; call again whenever ``Meta`` is replaced.
+        """
+        fields = getattr(cls, "model_fields", {}) or {}
+        nested_fields: List[Tuple[str, str]] = []
+        for field_name, field_info in fields.items():
+            kind = _nested_field_kind(field_info.annotation)
+            if kind != "leaf":
+                nested_fields.append((field_name, kind))
+        cls.__fv_nested_fields__ = tuple(nested_fields)
+        cls.__fv_has_nested_schemas__ = bool(nested_fields)
+        rules = tuple(cls._normalize_rules(getattr(cls.Meta, "rules", None) or ()))
+        cls.__fv_rules__ = rules
+        cls.__fv_has_rules__ = bool(rules) or bool(nested_fields)
+        roots = [rule._root for rule in rules]
+        # Computed fields are always dumped but never in model_fields_set, so
+        # rules rooted at one must always run.
+        computed = getattr(cls, "model_computed_fields", {}) or {}
+        cls.__fv_rule_roots__ = (
+            None if None in roots or any(root in computed for root in roots) else frozenset(roots)
+        )
+        cls.__fv_rule_trie__ = _RuleTrie.build(rules)
+        cls.__fv_dump_plan__ = _dump_plan(cls)
+        cls.__fv_scalar_fields__ = (
+            tuple(fields)
+            if cls.__fv_dump_plan__ is not None
+            and all(schema_cls is None for _, schema_cls in cls.__fv_dump_plan__)
+            else None
+        )
+        cls.__fv_concurrent_nested__ = bool(getattr(cls.Meta, "concurrent_nested", False))
+        cls.__fv_sync__ = all(rule._all_sync for rule in rules) and all(
+            kind != "walk" and _declares_sync_schema(fields[field_name].annotation)
+            for field_name, kind in nested_fields
+        )
+
     async def validate(self, *, partial: bool = False) -> None:
-        self._validated = None
-        nested_errors = await self._gather_nested_schema_errors(partial=partial)
-        data = self.model_dump(exclude_unset=partial)
+        if self.__fv_sync__ and self._can_validate_sync(partial=partial):
+            self._run_validation_sync(partial=partial)
+            return
+        await self._run_validation(partial=partial)
 
-        raw_rules = getattr(self.Meta, "rules", []) or []
-        rules: List[Schema.Rule] = self._normalize_rules(raw_rules)
-        errors: List[dict[str, Any]] = list(nested_errors)
+    def validate_sync(self, *, partial: bool = False) -> None:
+        """
+        Run rule validation without an event loop.
 
-        for rule in rules:
-            matches = resolve_path_expressions(data, rule.path)
-            for loc, value in matches:
-                for validator in rule.validators:
-                    try:
+        Only available when every validator on this schema and on the nested
+        schemas it holds is synchronous (see `ValidatorRule.sync_validate`).
+
+        Raises:
+            TypeError: If some validator has to be awaited.
+            ValidationRuleException: If validation fails.
+        """
+        if not (self.__fv_sync__ and self._can_validate_sync(partial=partial)):
+            raise TypeError(
+                f"{type(self).__name__} has asynchronous validators; use `await validate()`"
+            )
+        self._run_validation_sync(partial=partial)
+
+    async def _run_validation(self, *, partial: bool) -> None:
+        data = self._start_validation(partial=partial)
+        if data is None:
+            return
+
+        # Stays None on the (common) success path; created on the first error.
+        errors = await self._gather_nested_schema_errors(partial=partial)
+        for rule, loc, value in self._iter_rule_matches(data):
+            for validator in rule.validators:
+                try:
+                    if validator.is_sync:
+                        validator.sync_validate(value=value, data=data, loc=loc)
+                    else:
                         await validator.validate(value=value, data=data, loc=loc)
-                    except ValidationRuleException as exc:
-                        if exc.errors:
-                            errors.extend(exc.errors)
-                        else:
-                            errors.append(
-                                {
-                                    "loc": tuple(loc) if loc else tuple(),
-                                    "msg": exc.message,
-                                    "type": exc.error_type,
-                                }
-                            )
+                except ValidationRuleException as exc:
+                    errors = self._collect_rule_error(errors, exc, loc)
+        self._finish_validation(data, errors)
+
+    def _run_validation_sync(self, *, partial: bool) -> None:
+        data = self._start_validation(partial=partial)
+        if data is None:
+            return
 
+        errors = self._gather_nested_schema_errors_sync(partial=partial)
+        for rule, loc, value in self._iter_rule_matches(data):
+            for validator in rule.validators:
+                try:
+                    validator.sync_validate(value=value, data=data, loc=loc)
+                except ValidationRuleException as exc:
+                    errors = self._collect_rule_error(errors, exc, loc)
+        self._finish_validation(data, errors)
+
+    def _start_validation(self, *, partial: bool) -> dict[str, Any] | None:
+        """Dump for the rules to check, or ``None`` when nothing can fail."""
+        self._validated = None
+        data = self._dump(partial=partial)
+        if not self.__fv_has_rules__ or (partial and not self._has_set_rule_targets()):
+            # Nothing to check, but `validated` is still the snapshot taken now.
+            self._validated = data
+            return None
+        return data
+
+    def _dump(self, *, partial: bool) -> dict[str, Any]:
+        """
+        ``model_dump(exclude_unset=partial)``, built directly from ``__dict__``
+        when every field is a scalar that pydantic would emit unchanged or a
+        nested schema that can in turn dump itself this way.
+        """
+        if self.__fv_dump_plan__ is None:
+            return self.model_dump(exclude_unset=partial)
+        try:
+            return self._dump_from_dict(partial=partial)
+        except KeyError:
+            # model_construct() may leave fields out of __dict__ entirely.
+            return self.model_dump(exclude_unset=partial)
+
+    def _dump_from_dict(self, *, partial: bool) -> dict[str, Any]:
+        names = self.__fv_scalar_fields__
+        values = self.__dict__
+        if names is not None:
+            if partial:
+                fields_set = self.model_fields_set
+                return {name: values[name] for name in names if name in fields_set}
+            return {name: values[name] for name in names}
+
+        fields_set = self.model_fields_set if partial else None
+        dumped: dict[str, Any] = {}
+        for name, schema_cls in self.__fv_dump_plan__:  # type: ignore[union-attr]
+            if fields_set is not None and name not in fields_set:
+                continue
+            value = values[name]
+            if schema_cls is not None and value is not None:
+                if type(value) is not schema_cls:
+                    # pydantic dumps other instances by the declared type.
+                    return self.model_dump(exclude_unset=partial)
+                value = value._dump(partial=partial)
+            dumped[name] = value
+        return dumped
+
+    def _has_set_rule_targets(self) -> bool:
+        """Whether a partial validation has any set field a rule or nested schema can reach."""
+        roots = self.__fv_rule_roots__
+        fields_set = self.model_fields_set
+        if roots is None or not fields_set.isdisjoint(roots):
+            return True
+        return any(field_name in fields_set for field_name, _ in self.__fv_nested_fields__)
+
+    def _iter_rule_matches(
+        self,
+        data: dict[str, Any],
+    ) -> Iterator[Tuple["Schema.Rule", Tuple[str, ...], Any]]:
+        trie = self.__fv_rule_trie__
+        if trie is not None:
+            yield from trie.iter_matches(data)
+            return
+        for rule in self.__fv_rules__:
+            if rule._root is not None and rule._root not in data:
+                continue
+            for loc, value in rule._resolver(data):
+                yield rule, loc, value
+
+    @staticmethod
+    def _collect_rule_error(
+        errors: List[dict[str, Any]] | None,
+        exc: ValidationRuleException,
+        loc: Tuple[str, ...],
+    ) -> List[dict[str, Any]]:
+        if errors is None:
+            errors = []
+        if exc.errors:
+            errors.extend(exc.errors)
+        else:
+            errors.append(
+                {
+                    "loc": tuple(loc) if loc else tuple(),
+                    "msg": exc.message,
+                    "type": exc.error_type,
+                }
+            )
+        return errors
+
+    def _finish_validation(
+        self,
+        data: dict[str, Any],
+        errors: List[dict[str, Any]] | None,
+    ) -> None:
         if errors:
             raise ValidationRuleException(
                 "schema rule validation failed",
@@ -81,21 +311,95 @@ class Schema(BaseModel):
             )
         return self._validated
 
-    async def _gather_nested_schema_errors(self, *, partial: bool) -> List[dict[str, Any]]:
-        errors: List[dict[str, Any]] = []
-        fields = getattr(self.__class__, "model_fields", {}) or {}
-        for field_name in fields:
+    async def _gather_nested_schema_errors(
+        self,
+        *,
+        partial: bool,
+    ) -> List[dict[str, Any]] | None:
+        if not self.__fv_has_nested_schemas__:
+            return None
+        if self.__fv_concurrent_nested__:
+            return await self._gather_nested_schema_errors_concurrently(partial=partial)
+
+        errors: List[dict[str, Any]] | None = None
+        for child, loc in self._iter_nested_children(partial=partial):
+            try:
+                await self._validate_nested(child, partial=partial)
+            except ValidationRuleException as exc:
+                if errors is None:
+                    errors = []
+                self._format_nested_errors(exc, loc, errors)
+        return errors
+
+    async def _gather_nested_schema_errors_concurrently(
+        self,
+        *,
+        partial: bool,
+    ) -> List[dict[str, Any]] | None:
+        children = list(self._iter_nested_children(partial=partial))
+        if not children:
+            return None
+
+        results = await asyncio.gather(
+            *(self._validate_nested(child, partial=partial) for child, _ in children),
+            return_exceptions=True,
+        )
+        errors: List[dict[str, Any]] | None = None
+        for (_, loc), result in zip(children, results):
+            if isinstance(result, ValidationRuleException):
+                if errors is None:
+                    errors = []
+                self._format_nested_errors(result, loc, errors)
+            elif isinstance(result, BaseException):
+                raise result
+        return errors
+
+    def _gather_nested_schema_errors_sync(
+        self,
+        *,
+        partial: bool,
+    ) -> List[dict[str, Any]] | None:
+        if not self.__fv_has_nested_schemas__:
+            return None
+        errors: List[dict[str, Any]] | None = None
+        for child, loc in self._iter_nested_children(partial=partial):
+            try:
+                child._run_validation_sync(partial=partial)
+            except ValidationRuleException as exc:
+                if errors is None:
+                    errors = []
+                self._format_nested_errors(exc, loc, errors)
+        return errors
+
+    def _iter_nested_children(
+        self,
+        *,
+        partial: bool,
+    ) -> Iterator[Tuple["Schema", _LocChain]]:
+        for field_name, kind in self.__fv_nested_fields__:
             if partial and field_name not in self.model_fields_set:
                 continue
             value = getattr(self, field_name, None)
-            errors.extend(
-                await self._collect_errors_from_value(
-                    value=value,
-                    loc_prefix=(field_name,),
-                    partial=partial,
-                )
-            )
-        return errors
+            if value is None:
+                continue
+            yield from _NESTED_FIELD_WALKERS[kind](value, (None, field_name))
+
+    def _can_validate_sync(self, *, partial: bool) -> bool:
+        """
+        Check the nested schemas actually held, not just the declared ones.
+
+        A base-typed field may hold a subclass instance with async rules or
+        an overridden validate(); those force the async path.
+        """
+        if not self.__fv_has_nested_schemas__:
+            return True
+        for child, _ in self._iter_nested_children(partial=partial):
+            child_cls = type(child)
+            if not child_cls.__fv_sync__ or child_cls.validate is not Schema.validate:
+                return False
+            if not child._can_validate_sync(partial=partial):
+                return False
+        return True
 
     @staticmethod
     def _normalize_rules(raw_rules: Any) -> List["Schema.Rule"]:
@@ -116,66 +420,29 @@ class Schema(BaseModel):
                 )
             return normalized
 
-        if isinstance(raw_rules, (list, tuple)):
-            return list(raw_rules)
-
         if isinstance(raw_rules, Iterable) and not isinstance(raw_rules, (str, bytes)):
-            return list(raw_rules)
+            return [_as_rule(rule) for rule in raw_rules]
 
         raise TypeError(
             "Meta.rules must be a list of Schema.Rule instances or a mapping of path to validators."
         )
 
-    async def _collect_errors_from_value(
-        self,
-        *,
-        value: Any,
-        loc_prefix: Tuple[str, ...],
-        partial: bool,
-    ) -> List[dict[str, Any]]:
-        if value is None:
-            return []
-
-        if isinstance(value, Schema):
-            try:
-                await value.validate(partial=partial)
-            except ValidationRuleException as exc:
-                return self._format_nested_errors(exc, loc_prefix)
-            return []
-
-        if isinstance(value, dict):
-            errors: List[dict[str, Any]] = []
-            for key, item in value.items():
-                errors.extend(
-                    await self._collect_errors_from_value(
-                        value=item,
-                        loc_prefix=loc_prefix + (str(key),),
-                        partial=partial,
-                    )
-                )
-            return errors
-
-        if isinstance(value, (list, tuple)):
-            errors: List[dict[str, Any]] = []
-            for idx, item in enumerate(value):
-                errors.extend(
-                    await self._collect_errors_from_value(
-                        value=item,
-                        loc_prefix=loc_prefix + (str(idx),),
-                        partial=partial,
-                    )
-                )
-            return errors
-
-        return []
+    @staticmethod
+    async def _validate_nested(schema: "Schema", *, partial: bool) -> None:
+        if type(schema).validate is not Schema.validate:
+            # Respect overridden validate() implementations.
+            await schema.validate(partial=partial)
+            return
+        await schema._run_validation(partial=partial)
 
     def _format_nested_errors(
         self,
         exc: ValidationRuleException,
-        loc_prefix: Tuple[str, ...],
-    ) -> List[dict[str, Any]]:
+        loc_chain: _LocChain,
+        errors: List[dict[str, Any]],
+    ) -> None:
+        loc_prefix = _flatten_loc(loc_chain)
         if exc.errors:
-            formatted: List[dict[str, Any]] = []
             for error in exc.errors:
                 child_error = dict(error)
                 raw_loc = child_error.get("loc", tuple())
@@ -185,13 +452,297 @@ class Schema(BaseModel):
                     else (str(raw_loc),)
                 )
                 child_error["loc"] = loc_prefix + child_loc
-                formatted.append(child_error)
-            return formatted
+                errors.append(child_error)
+            return
 
-        return [
+        errors.append(
             {
                 "loc": loc_prefix + exc.loc,
                 "msg": exc.message,
                 "type": exc.error_type,
             }
-        ]
+        )
+
+
+def _as_rule(rule: Any) -> Schema.Rule:
+    """Wrap rule-like objects (with ``path`` and ``validators``) as ``Schema.Rule``."""
+    if isinstance(rule, Schema.Rule):
+        return rule
+    try:
+        path, validators = rule.path, rule.validators
+    except AttributeError:
+        raise TypeError(
+            "Meta.rules entries must be Schema.Rule instances or objects with path and validators."
+        ) from None
+    return Schema.Rule(path, list(validators))
+
+
+class _RuleTrie:
+    """
+    Resolves a schema's rules through one ``PathTrie`` walk.
+
+    Matches are still yielded rule by rule, in ``Meta.rules`` order, so the
+    order of validator calls and collected errors is unchanged.
+    """
+
+    __slots__ = ("rules", "paths")
+
+    def __init__(self, rules: Tuple[Schema.Rule, ...]) -> None:
+        self.rules = rules
+        self.paths = PathTrie([rule.path for rule in rules])
+
+    @classmethod
+    def build(cls, rules: Tuple[Schema.Rule, ...]) -> "_RuleTrie | None":
+        # Without shared prefixes the per-rule resolvers do the same work
+        # with less overhead (and may use the native walker).
+        if len(rules) < 2:
+            return None
+        trie = cls(rules)
+        return trie if trie.paths.shares_prefix else None
+
+    def iter_matches(
+        self,
+        data: dict[str, Any],
+    ) -> Iterator[Tuple[Schema.Rule, Tuple[str, ...], Any]]:
+        for rule, matches in zip(self.rules, self.paths.resolve(data)):
+            for loc, value in matches:
+                yield rule, loc, value
+
+
+def _iter_nested_schemas(
+    value: Any,
+    loc: _LocChain,
+) -> Iterator[Tuple[Schema, _LocChain]]:
+    """
+    Yield ``(schema, loc)`` for every Schema reachable from ``value``.
+
+    Walks dicts, lists and tuples depth-first with an explicit stack, in the
+    same order a recursive walk would. Stack entries carry their parent chain
+    and segment separately, so leaves cost no location allocation at all.
+    """
+    schema_cls = Schema
+    parent, segment = loc  # type: ignore[misc]
+    stack: Deque[Tuple[Any, _LocChain, str]] = deque([(value, parent, segment)])
+    while stack:
+        current, parent, segment = stack.pop()
+        # Exact type checks first; isinstance only for subclasses and Schemas.
+        current_type = type(current)
+        if current_type in _LEAF_TYPES:
+            continue
+        if current_type is dict or current_type is list or current_type is tuple:
+            container: type | None = current_type
+        elif isinstance(current, schema_cls):
+            yield current, (parent, segment)
+            continue
+        elif isinstance(current, dict):
+            container = dict
+        elif isinstance(current, (list, tuple)):
+            container = list
+        else:
+            continue
+
+        chain = (parent, segment)
+        if container is dict:
+            stack.extend(reversed([(item, chain, str(key)) for key, item in current.items()]))
+        else:
+            stack.extend(
+                reversed(
+                    [
+                        (item, chain, _SMALL_INT_STRS[idx] if idx < _SMALL_INT_COUNT else str(idx))
+                        for idx, item in enumerate(current)
+                    ]
+                )
+            )
+
+
+def _iter_schema_field(
+    value: Any,
+    loc: _LocChain,
+) -> Iterator[Tuple[Schema, _LocChain]]:
+    # model_construct() and in-place mutation bypass pydantic's validation.
+    if isinstance(value, Schema):
+        yield value, loc
+
+
+def _iter_list_of_schema_field(
+    value: Any,
+    loc: _LocChain,
+) -> Iterator[Tuple[Schema, _LocChain]]:
+    for idx, item in enumerate(value):
+        if isinstance(item, Schema):
+            segment = _SMALL_INT_STRS[idx] if idx < _SMALL_INT_COUNT else str(idx)
+            yield item, (loc, segment)
+
+
+def _iter_dict_of_schema_field(
+    value: Any,
+    loc: _LocChain,
+) -> Iterator[Tuple[Schema, _LocChain]]:
+    for key, item in value.items():
+        if isinstance(item, Schema):
+            yield item, (loc, str(key))
+
+
+def _flatten_loc(chain: _LocChain) -> Tuple[str, ...]:
+    segments: List[str] = []
+    while chain is not None:
+        chain, segment = chain
+        segments.append(segment)
+    segments.reverse()
+    return tuple(segments)
+
+
+_NESTED_FIELD_WALKERS = {
+    "schema": _iter_schema_field,
+    "list_of_schema": _iter_list_of_schema_field,
+    "dict_of_schema": _iter_dict_of_schema_field,
+    "walk": _iter_nested_schemas,
+}
+
+
+def _nested_field_kind(annotation: Any) -> str:
+    """
+    Classify how a field annotated with ``annotation`` can hold nested Schemas.
+
+    Returns ``"leaf"`` (never), ``"schema"``, ``"list_of_schema"``,
+    ``"dict_of_schema"``, or ``"walk"`` when the value has to be searched.
+    """
+    if not _may_contain_schema(annotation):
+        return "leaf"
+
+    annotation = _unwrap_optional(annotation)
+    if _is_schema_class(annotation):
+        return "schema"
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (list, abc.Sequence, abc.MutableSequence) and len(args) == 1:
+        if _is_schema_class(_unwrap_optional(args[0])):
+            return "list_of_schema"
+    elif origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        if _is_schema_class(_unwrap_optional(args[0])):
+            return "list_of_schema"
+    elif origin in (dict, abc.Mapping, abc.MutableMapping) and len(args) == 2:
+        if _is_schema_class(_unwrap_optional(args[1])):
+            return "dict_of_schema"
+    return "walk"
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+            continue
+        if origin is Union or origin is UnionType:
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) == 1:
+                annotation = args[0]
+                continue
+        return annotation
+
+
+def _is_schema_class(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Schema)
+
+
+def _declares_sync_schema(annotation: Any) -> bool:
+    """Whether the Schema class named by a typed nested field validates synchronously."""
+    annotation = _unwrap_optional(annotation)
+    args = get_args(annotation)
+    if args:
+        # list[S], tuple[S, ...] and Sequence[S] keep the item first; mappings last.
+        origin = get_origin(annotation)
+        item = args[-1] if origin in (dict, abc.Mapping, abc.MutableMapping) else args[0]
+        annotation = _unwrap_optional(item)
+    return annotation.__fv_sync__ and annotation.validate is Schema.validate
+
+
+def _may_contain_schema(annotation: Any) -> bool:
+    """
+    Whether a field annotated with ``annotation`` may hold a nested Schema.
+
+    Anything that cannot be classified (forward references, ``Any``, type
+    variables) is conservatively treated as possibly containing one.
+    """
+    if annotation is None or annotation is type(None):
+        return False
+
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _may_contain_schema(get_args(annotation)[0])
+    if origin is Literal:
+        return False
+    if origin is not None:
+        args = get_args(annotation)
+        if not args:
+            return _may_contain_schema(origin)
+        return any(_may_contain_schema(arg) for arg in args if arg is not Ellipsis)
+
+    if annotation is Any or not isinstance(annotation, type):
+        return True
+    if issubclass(annotation, (Schema, dict, list, tuple)):
+        return True
+    # Supertypes like ``object``, ``Sequence`` or ``BaseModel`` may hold
+    # containers or Schemas too.
+    return any(issubclass(container, annotation) for container in (dict, list, tuple, Schema))
+
+
+def _dump_plan(cls: type[Schema]) -> Tuple[Tuple[str, type[Schema] | None], ...] | None:
+    """
+    How to build ``model_dump`` of ``cls`` without pydantic's serializer.
+
+    Each field maps to ``None`` when it dumps to its stored value, or to the
+    Schema class of a nested field whose instances can ``_dump`` themselves.
+    Returns ``None`` when any field, serializer, computed field, extra value,
+    alias-keyed dump or ``model_dump`` override needs pydantic, in which case
+    ``model_dump`` is used.
+    """
+    decorators = cls.__pydantic_decorators__
+    if decorators.field_serializers or decorators.model_serializers:
+        return None
+    if getattr(cls, "model_computed_fields", None):
+        return None
+    if cls.model_config.get("extra") == "allow" or cls.model_config.get("serialize_by_alias"):
+        return None
+    if cls.model_dump is not BaseModel.model_dump:
+        return None
+    plan: List[Tuple[str, type[Schema] | None]] = []
+    for field_name, field_info in cls.model_fields.items():
+        if field_info.exclude or getattr(field_info, "exclude_if", None) is not None:
+            return None
+        if not all(isinstance(item, _CONSTRAINT_METADATA) for item in field_info.metadata):
+            return None
+        if _is_scalar_annotation(field_info.annotation):
+            plan.append((field_name, None))
+            continue
+        annotation = field_info.annotation
+        nested = _unwrap_optional(annotation)
+        # Plain ``S`` or ``S | None`` only: an inner Annotated may serialize.
+        # Only classes already prepared; a schema referring to itself is not.
+        if (
+            (annotation is nested or set(get_args(annotation)) == {nested, type(None)})
+            and _is_schema_class(nested)
+            and "__fv_dump_plan__" in nested.__dict__
+            and nested.__fv_dump_plan__ is not None
+        ):
+            plan.append((field_name, nested))
+            continue
+        return None
+    return tuple(plan)
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        args = get_args(annotation)
+        return _is_scalar_annotation(args[0]) and all(
+            isinstance(item, _CONSTRAINT_METADATA) for item in args[1:]
+        )
+    if origin is Literal:
+        return True
+    if origin is Union or origin is UnionType:
+        return all(_is_scalar_annotation(arg) for arg in get_args(annotation))
+    if not isinstance(annotation, type):
+        return False
+    return annotation in _SCALAR_TYPES or issubclass(annotation, Enum)
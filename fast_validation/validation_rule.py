@@ -1,11 +1,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Sequence
+from typing import Any, ClassVar, Sequence
 
 
 class ValidatorRule(ABC):
-    """Contract for post-parse validation rules used by `Schema`."""
+    """
+    Contract for post-parse validation rules used by `Schema`.
+
+    Rules that never await anything can implement `sync_validate` instead of
+    `validate`; such rules are marked `is_sync` and `Schema` calls them
+    without creating a coroutine per value.
+    """
+
+    # Set automatically for subclasses that define `sync_validate`.
+    is_sync: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "sync_validate" in cls.__dict__:
+            cls.is_sync = True
+            if "validate" not in cls.__dict__:
+                cls.validate = ValidatorRule._validate_via_sync  # type: ignore[method-assign]
+        elif "validate" in cls.__dict__:
+            # An async override of a sync rule must be awaited again.
+            cls.is_sync = False
 
     @abstractmethod
     async def validate(self, *, value: Any, data: dict, loc: Sequence[str]) -> None:  # pragma: no cover - interface only
@@ -17,4 +36,16 @@ class ValidatorRule(ABC):
         """
         raise NotImplementedError
 
+    def sync_validate(self, *, value: Any, data: dict, loc: Sequence[str]) -> None:  # pragma: no cover - interface only
+        """
+        Synchronous entry point for rules that do no I/O.
+
+        Same contract as `validate`; implementing it marks the rule `is_sync`.
+
+        Raises:
+            ValidationRuleException: If the validation fails.
+        """
+        raise NotImplementedError
 
+    async def _validate_via_sync(self, *, value: Any, data: dict, loc: Sequence[str]) -> None:
+        self.sync_validate(value=value, data=data, loc=loc)
@@ -0,0 +1,82 @@
+"""
+Optional compiled builds of the hot-path modules.
+
+Building a wheel with ``FAST_VALIDATION_CYTHONIZE=1`` compiles the modules in
+``CYTHON_MODULES`` into extension modules shipped alongside their ``.py``
+sources. ``FAST_VALIDATION_NATIVE=1`` builds the hand-written C extensions in
+``NATIVE_EXTENSIONS``. Without either variable the wheel stays pure Python
+and no compiler, Cython or setuptools is required.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+CYTHONIZE_ENV = "FAST_VALIDATION_CYTHONIZE"
+NATIVE_ENV = "FAST_VALIDATION_NATIVE"
+# schema.py is deliberately absent: pydantic rejects Cython function objects
+# in a model namespace ("non-annotated attribute"), so Schema must stay Python.
+CYTHON_MODULES = ["fast_validation/paths.py"]
+COMPILER_DIRECTIVES = {"boundscheck": False, "wraparound": False, "cdivision": True}
+# Imported with a pure-Python fallback, see fast_validation/paths.py.
+NATIVE_EXTENSIONS = {"fast_validation._paths": ["fast_validation/_paths.c"]}
+
+
+class CompiledBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def dependencies(self) -> List[str]:
+        requirements: List[str] = []
+        if self._enabled(CYTHONIZE_ENV):
+            requirements.append("cython>=3")
+        if self._enabled(CYTHONIZE_ENV) or self._enabled(NATIVE_ENV):
+            requirements.append("setuptools")
+        return requirements
+
+    def initialize(self, version: str, build_data: Dict[str, Any]) -> None:
+        cythonize_enabled = self._enabled(CYTHONIZE_ENV)
+        native_enabled = self._enabled(NATIVE_ENV)
+        if not (cythonize_enabled or native_enabled):
+            return
+
+        # Imported lazily: these are only build requirements when enabled.
+        from setuptools import Distribution, Extension
+        from setuptools.command.build_ext import build_ext
+
+        extensions: List[Any] = []
+        if native_enabled:
+            extensions.extend(
+                Extension(name, sources) for name, sources in NATIVE_EXTENSIONS.items()
+            )
+        if cythonize_enabled:
+            from Cython.Build import cythonize
+
+            extensions.extend(
+                cythonize(
+                    CYTHON_MODULES,
+                    language_level=3,
+                    compiler_directives=COMPILER_DIRECTIVES,
+                )
+            )
+
+        # Build outside the source tree so a stale extension never shadows
+        # the .py module during development.
+        build_lib = os.path.join(self.root, "build", "compiled")
+        command = build_ext(Distribution({"name": "fast-validation", "ext_modules": extensions}))
+        command.build_lib = build_lib
+        command.build_temp = os.path.join(build_lib, "temp")
+        command.ensure_finalized()
+        command.run()
+
+        for extension in extensions:
+            built_path = command.get_ext_fullpath(extension.name)
+            relative_path = os.path.relpath(built_path, build_lib)
+            build_data["force_include"][built_path] = relative_path.replace(os.sep, "/")
+        build_data["pure_python"] = False
+        build_data["infer_tag"] = True
+
+    def _enabled(self, env_var: str) -> bool:
+        return self.target_name == "wheel" and os.environ.get(env_var) == "1"
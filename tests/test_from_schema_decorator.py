@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import get_args
+from copy import copy
+from decimal import Decimal
+from typing import Any, Optional, Union, get_args
 
 from pydantic import Field
+from pydantic.fields import FieldInfo
 
 from fast_validation import Schema, from_schema
+from fast_validation.from_schema import _clone_field_info, _optionalize
 
 
 class BaseProductSchema(Schema):
@@ -68,6 +72,14 @@ def test_from_schema_partial_makes_fields_optional():
     assert type(None) in get_args(name_field.annotation)
 
 
+def test_optionalize_keeps_existing_optionals_equivalent():
+    assert _optionalize(int | None) == Optional[int]
+    assert _optionalize(Optional[int]) == Optional[int]
+    assert _optionalize(int | str) == Optional[Union[int, str]]
+    assert _optionalize(Any) == Optional[Any]
+    assert _optionalize(list[int]) is _optionalize(list[int])
+
+
 def test_partial_schema_respects_field_overrides():
     price_field = ProductUpdateWithOverride.model_fields["price"]
     assert price_field.description == "Price override."
@@ -92,3 +104,45 @@ def test_partial_schema_with_schema_base_skips_abc_internal_private_attrs():
     schema = ProductUpdateSchemaBase()
     assert schema.model_dump(exclude_unset=True) == {}
     assert "_abc_impl" not in ProductUpdateSchemaBase.__private_attributes__
+
+
+def _make_patch_schema(default_quantity: int = 1):
+    @from_schema(BaseProductSchema, partial=True)
+    class FactoryPatchSchema:
+        quantity: int = default_quantity
+
+    return FactoryPatchSchema
+
+
+def test_identical_declarations_reuse_derived_schema():
+    assert _make_patch_schema() is _make_patch_schema()
+
+
+def test_differing_declarations_build_distinct_schemas():
+    first = _make_patch_schema(1)
+    second = _make_patch_schema(2)
+    assert first is not second
+    assert second.model_fields["quantity"].default == 2
+    assert _make_patch_schema(True) is not first
+
+    # Equal but distinguishable defaults must not share a derived class.
+    for left, right in (
+        ((1,), (True,)),
+        (Decimal("1.0"), Decimal("1.00")),
+        (0.0, -0.0),
+        (frozenset({1}), frozenset({True})),
+    ):
+        left_schema = _make_patch_schema(left)
+        right_schema = _make_patch_schema(right)
+        assert left_schema is not right_schema
+        assert repr(right_schema.model_fields["quantity"].default) == repr(right)
+    assert _make_patch_schema((1, "a")) is _make_patch_schema((1, "a"))
+
+
+def test_field_info_clone_matches_copy():
+    for field_info in BaseProductSchema.model_fields.values():
+        clone = _clone_field_info(field_info)
+        expected = copy(field_info)
+        assert clone is not field_info
+        for name in FieldInfo.__slots__:
+            assert getattr(clone, name, None) == getattr(expected, name, None), name
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from typing import Any
+
 import pytest
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from fast_validation import Schema, ValidatorRule, ValidationRuleException
 
@@ -78,3 +83,347 @@ async def test_nested_schema_validation_errors_are_prefixed_with_parent_path():
 
     errors = excinfo.value.errors or []
     assert errors and errors[0]["loc"] == ("data", "rep_id")
+
+
+@pytest.mark.asyncio
+async def test_nested_validated_data_is_not_shared_with_the_parent():
+    schema = UpdateStockToolSchema(stock_id=1, data={"name": "x", "rep_id": 2})
+    await schema.validate()
+
+    assert schema.validated == {"stock_id": 1, "data": {"name": "x", "rep_id": 2}}
+    assert schema.data.validated == {"name": "x", "rep_id": 2}
+    assert schema.data.validated is not schema.validated["data"]
+    schema.data.validated["rep_id"] = 3
+    assert schema.validated["data"]["rep_id"] == 2
+
+
+@pytest.mark.asyncio
+async def test_nested_subclass_instance_sees_its_own_fields():
+    seen: list[dict] = []
+
+    class DataRecorder(ValidatorRule):
+        async def validate(self, *, value, data, loc):
+            seen.append(data)
+
+    class ExtendedStockPatchSchema(StockPatchSchema):
+        note: str = "extra"
+
+        class Meta:
+            rules = [Schema.Rule("$.note", [DataRecorder()])]
+
+    schema = UpdateStockToolSchema(stock_id=1, data=ExtendedStockPatchSchema(rep_id=2))
+    await schema.validate()
+
+    assert seen == [{"name": None, "rep_id": 2, "note": "extra"}]
+
+
+@pytest.mark.asyncio
+async def test_schema_without_rules_still_exposes_validated():
+    class PlainSchema(Schema):
+        name: str
+        tags: list[str] = []
+
+    assert PlainSchema.__fv_has_rules__ is False
+    assert UpdateStockToolSchema.__fv_has_rules__ is True
+
+    schema = PlainSchema(name="a")
+    await schema.validate(partial=True)
+    assert schema.validated == {"name": "a"}
+
+    # validated is a snapshot taken by validate(), not by the first read.
+    await schema.validate()
+    schema.name = "b"
+    assert schema.validated == {"name": "a", "tags": []}
+
+
+@pytest.mark.asyncio
+async def test_any_field_holding_a_schema_keeps_nested_rules():
+    class LooseSchema(Schema):
+        payload: Any = None
+
+    assert LooseSchema.__fv_has_rules__ is True
+
+    schema = LooseSchema(payload=[StockPatchSchema(rep_id=None)])
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert (excinfo.value.errors or [])[0]["loc"] == ("payload", "0", "rep_id")
+
+
+@pytest.mark.asyncio
+async def test_nested_schemas_in_containers_are_validated_in_order():
+    class BatchSchema(Schema):
+        patches: list[StockPatchSchema]
+        by_key: dict[str, StockPatchSchema] = {}
+
+    schema = BatchSchema(
+        patches=[{"rep_id": None}, {"rep_id": 1}, {"rep_id": None}],
+        by_key={"a": {"rep_id": None}},
+    )
+
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert [error["loc"] for error in excinfo.value.errors or []] == [
+        ("patches", "0", "rep_id"),
+        ("patches", "2", "rep_id"),
+        ("by_key", "a", "rep_id"),
+    ]
+    assert schema.patches[1].validated == {"name": None, "rep_id": 1}
+
+
+def test_nested_field_kinds_are_precomputed():
+    class MixedSchema(Schema):
+        count: int
+        tags: list[str] = []
+        patch: StockPatchSchema | None = None
+        patches: list[StockPatchSchema] = []
+        patches_by_key: dict[str, StockPatchSchema] = {}
+        anything: Any = None
+
+    assert MixedSchema.__fv_nested_fields__ == (
+        ("patch", "schema"),
+        ("patches", "list_of_schema"),
+        ("patches_by_key", "dict_of_schema"),
+        ("anything", "walk"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_untyped_fields_are_still_searched_for_nested_schemas():
+    class LooseSchema(Schema):
+        payload: Any = None
+
+    schema = LooseSchema(payload={"inner": [StockPatchSchema(rep_id=None)]})
+
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert (excinfo.value.errors or [])[0]["loc"] == ("payload", "inner", "0", "rep_id")
+
+
+@pytest.mark.asyncio
+async def test_container_subclasses_are_searched_for_nested_schemas():
+    class LooseSchema(Schema):
+        payload: Any = None
+
+    schema = LooseSchema(
+        payload=OrderedDict(inner=(StockPatchSchema(rep_id=1), StockPatchSchema(rep_id=None)))
+    )
+
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert [error["loc"] for error in excinfo.value.errors or []] == [
+        ("payload", "inner", "1", "rep_id"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_subclass_in_sync_declared_field_uses_async_path():
+    class SyncRequire(ValidatorRule):
+        def sync_validate(self, *, value, data, loc):
+            if value is None:
+                raise ValidationRuleException("value is required", loc=tuple(loc))
+
+    class SyncPatchSchema(Schema):
+        rep_id: int | None = None
+
+        class Meta:
+            rules = [Schema.Rule("$.rep_id", [SyncRequire()])]
+
+    class AsyncPatchSchema(SyncPatchSchema):
+        class Meta:
+            rules = [Schema.Rule("$.rep_id", [RequireValueValidator()])]
+
+    class ParentSchema(Schema):
+        patch: SyncPatchSchema
+
+    assert ParentSchema.__fv_sync__ is True
+
+    ParentSchema(patch={"rep_id": 1}).validate_sync()
+
+    schema = ParentSchema(patch=AsyncPatchSchema(rep_id=None))
+    with pytest.raises(TypeError):
+        schema.validate_sync()
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+    assert (excinfo.value.errors or [])[0]["loc"] == ("patch", "rep_id")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_nested_validation_overlaps_and_keeps_error_order():
+    running = 0
+    peak = 0
+
+    class SlowRequire(ValidatorRule):
+        async def validate(self, *, value, data, loc):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if value is None:
+                raise ValidationRuleException("value is required", loc=tuple(loc))
+
+    class SlowPatchSchema(Schema):
+        rep_id: int | None = None
+
+        class Meta:
+            rules = [Schema.Rule("$.rep_id", [SlowRequire()])]
+
+    class ConcurrentBatchSchema(Schema):
+        patches: list[SlowPatchSchema]
+
+        class Meta:
+            concurrent_nested = True
+
+    schema = ConcurrentBatchSchema(patches=[{"rep_id": None}, {"rep_id": 1}, {"rep_id": None}])
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert peak == 3
+    assert [error["loc"] for error in excinfo.value.errors or []] == [
+        ("patches", "0", "rep_id"),
+        ("patches", "2", "rep_id"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nested_locations_past_the_cached_index_range():
+    class LongSchema(Schema):
+        patches: list[StockPatchSchema]
+        payload: Any = None
+
+    patches = [StockPatchSchema(rep_id=1) for _ in range(1500)]
+    patches[3] = patches[1200] = StockPatchSchema(rep_id=None)
+    schema = LongSchema(patches=patches, payload=[0] * 1100 + [{"deep": patches[3]}])
+
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert [error["loc"] for error in excinfo.value.errors or []] == [
+        ("patches", "3", "rep_id"),
+        ("patches", "1200", "rep_id"),
+        ("payload", "1100", "deep", "rep_id"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_nested_schema_dump_skips_model_dump_when_equivalent():
+    class ExtendedPatchSchema(StockPatchSchema):
+        note: str = ""
+
+    class OptionalPatchSchema(Schema):
+        stock_id: int
+        patch: StockPatchSchema | None = None
+
+    assert UpdateStockToolSchema.__fv_dump_plan__ == (
+        ("stock_id", None),
+        ("data", StockPatchSchema),
+    )
+    assert UpdateStockToolSchema.__fv_scalar_fields__ is None
+
+    recorder = RecordingValidator()
+
+    class AliasedSchema(Schema):
+        model_config = ConfigDict(serialize_by_alias=True)
+        value: int = Field(serialization_alias="v")
+
+        class Meta:
+            rules = [Schema.Rule("$.v", [recorder])]
+
+    class CustomDumpSchema(Schema):
+        value: int
+
+        def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+            return {"custom": super().model_dump(**kwargs)}
+
+    assert AliasedSchema.__fv_dump_plan__ is None
+    assert CustomDumpSchema.__fv_dump_plan__ is None
+    aliased = AliasedSchema(value=1)
+    await aliased.validate()
+    assert recorder.calls == [("v",)]
+    assert aliased.validated == {"v": 1}
+
+    candidates = [
+        UpdateStockToolSchema(stock_id=1, data={"name": "x", "rep_id": 2}),
+        UpdateStockToolSchema(stock_id=1, data=StockPatchSchema(rep_id=2)),
+        UpdateStockToolSchema(stock_id=1, data=ExtendedPatchSchema(rep_id=2, note="n")),
+        OptionalPatchSchema(stock_id=1),
+        OptionalPatchSchema(stock_id=1, patch=None),
+        OptionalPatchSchema(stock_id=1, patch={"name": "y"}),
+        aliased,
+        CustomDumpSchema(value=1),
+    ]
+    for schema in candidates:
+        for partial in (False, True):
+            assert schema._dump(partial=partial) == schema.model_dump(exclude_unset=partial)
+
+
+@pytest.mark.asyncio
+async def test_parent_serializers_do_not_hide_nested_rule_failures():
+    class MustBePositive(ValidatorRule):
+        def sync_validate(self, *, value, data, loc):
+            if value <= 0:
+                raise ValidationRuleException("must be positive", loc=tuple(loc))
+
+    class Inner(Schema):
+        a: int
+
+        class Meta:
+            rules = [Schema.Rule("$.a", [MustBePositive()])]
+
+    class Outer(Schema):
+        inner: Inner
+
+        @field_serializer("inner")
+        def _serialize_inner(self, inner: Inner) -> dict:
+            return {"a": 5}
+
+    schema = Outer(inner={"a": -1})
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert (excinfo.value.errors or [])[0]["loc"] == ("inner", "a")
+
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("ignore::UserWarning")  # pydantic warns when dumping them
+async def test_unvalidated_non_schema_items_are_skipped():
+    class BatchSchema(Schema):
+        patch: StockPatchSchema | None = None
+        patches: list[StockPatchSchema] = []
+        by_key: dict[str, StockPatchSchema] = {}
+
+    schema = BatchSchema.model_construct(
+        patch={"rep_id": None},
+        patches=[{"rep_id": None}],
+        by_key={"a": {"rep_id": None}},
+    )
+    await schema.validate()
+
+    schema = BatchSchema(patches=[{"rep_id": 1}])
+    schema.patches.append({"rep_id": None})
+    await schema.validate()
+
+
+@pytest.mark.asyncio
+async def test_fields_typed_as_schema_supertypes_are_searched():
+    class LooseSchema(Schema):
+        payload: BaseModel
+        items: list[BaseModel] = []
+
+    assert LooseSchema.__fv_nested_fields__ == (("payload", "walk"), ("items", "walk"))
+
+    schema = LooseSchema(
+        payload=StockPatchSchema(rep_id=None),
+        items=[StockPatchSchema(rep_id=None)],
+    )
+    with pytest.raises(ValidationRuleException) as excinfo:
+        await schema.validate()
+
+    assert [error["loc"] for error in excinfo.value.errors or []] == [
+        ("payload", "rep_id"),
+        ("items", "0", "rep_id"),
+    ]
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import pickle
+from collections import namedtuple
+
 import pytest
+from pydantic import ConfigDict, computed_field
 
 from fast_validation import (
     Schema,
@@ -8,7 +12,7 @@ from fast_validation import (
     ValidationNotRunException,
     ValidationRuleException,
 )
-from fast_validation.paths import resolve_path_expressions
+from fast_validation.paths import PathTrie, compile_path, resolve_path_expressions
 
 
 class MustEqual(ValidatorRule):
@@ -24,6 +28,34 @@ class MustEqual(ValidatorRule):
             )
 
 
+class SyncMustEqual(ValidatorRule):
+    def __init__(self, expected: int) -> None:
+        self.expected = expected
+
+    def sync_validate(self, *, value, data, loc):
+        if value != self.expected:
+            raise ValidationRuleException(
+                f"must equal {self.expected}",
+                loc=tuple(loc),
+                error_type="value_error.mismatch",
+            )
+
+
+class SyncItemSchema(Schema):
+    value: int
+
+    class Meta:
+        rules = [Schema.Rule("$.value", [SyncMustEqual(42)])]
+
+
+class RecordingRule(ValidatorRule):
+    def __init__(self) -> None:
+        self.seen: list[tuple[str, ...]] = []
+
+    def sync_validate(self, *, value, data, loc):
+        self.seen.append(tuple(loc))
+
+
 class ItemSchema(Schema):
     value: int
 
@@ -74,6 +106,42 @@ def test_path_resolution_for_list_items():
     ]
 
 
+def test_compiled_path_matches_resolver_and_is_reused():
+    resolver = compile_path("$.a.items[*].x")
+    data = {"a": {"items": [{"x": 1}, {"y": 2}, {"x": 3}]}}
+    assert resolver(data) == resolve_path_expressions(data, "$.a.items[*].x")
+    assert resolver({"a": {"items": "not-a-list"}}) == []
+    assert compile_path("$.a.items[*].x") is resolver
+    assert compile_path("$")(data) == [((), data)]
+
+
+def test_compiled_path_handles_dotted_runs_around_wildcards():
+    data = {"a": {"b": [{"c": {"d": 1}}, {"c": {}}, {"c": {"d": 2}}]}, "x": {"y": {"z": 3}}}
+    assert compile_path("$.a.b[*].c.d")(data) == [
+        (("a", "b", "0", "c", "d"), 1),
+        (("a", "b", "2", "c", "d"), 2),
+    ]
+    assert compile_path("$.x.y.z")(data) == [(("x", "y", "z"), 3)]
+    assert compile_path("$.x.missing.z")(data) == []
+
+
+def test_native_walker_matches_python_steps():
+    native = pytest.importorskip("fast_validation._paths")
+    from fast_validation import paths
+
+    data = {"a": [{"b": {"c": 1}}, {"b": {}}, {"b": {"c": [2, 3]}}], "d": {"e": 4}}
+    for path_expr in ("$", "$.a[*].b.c", "$.a[*].b.c[*]", "$.d.e", "$.d[*]", "$.missing"):
+        tokens = paths._split_tokens(path_expr)
+        assert paths._compile_native(tokens)(data) == paths._compile_python(tokens)(data)
+    with pytest.raises(ValueError):
+        native.walk(data, bytes([native.DICT_STEP]), ())
+
+
+def test_compile_path_rejects_paths_without_root():
+    with pytest.raises(ValueError):
+        compile_path("a.b")
+
+
 @pytest.mark.asyncio
 async def test_dict_rules_are_supported():
     item = DictRuleSchema(value=41)
@@ -84,3 +152,233 @@ async def test_dict_rules_are_supported():
 
     ok = DictRuleSchema(value=42)
     await ok.validate()
+
+
+def test_sync_rules_can_be_validated_without_event_loop():
+    assert SyncMustEqual.is_sync is True
+    assert SyncItemSchema.__fv_sync__ is True
+
+    ok = SyncItemSchema(value=42)
+    ok.validate_sync()
+    assert ok.validated == {"value": 42}
+
+    bad = SyncItemSchema(value=41)
+    with pytest.raises(ValidationRuleException) as excinfo:
+        bad.validate_sync()
+    assert excinfo.value.errors and excinfo.value.errors[0]["loc"] == ("value",)
+
+
+@pytest.mark.asyncio
+async def test_sync_rules_run_through_async_validate():
+    bad = SyncItemSchema(value=41)
+    with pytest.raises(ValidationRuleException):
+        await bad.validate()
+
+    await SyncMustEqual(1).validate(value=1, data={}, loc=())
+
+
+def test_validate_sync_rejects_async_rules():
+    assert ItemSchema.__fv_sync__ is False
+    with pytest.raises(TypeError):
+        ItemSchema(value=42).validate_sync()
+
+
+class ProfileSchema(Schema):
+    name: str
+    age: int | None = None
+    tags: list[str] = []
+
+
+def test_scalar_only_schema_dump_matches_model_dump():
+    assert ItemSchema.__fv_scalar_fields__ == ("value",)
+    assert ProfileSchema.__fv_scalar_fields__ is None
+
+    item = ItemSchema(value=42)
+    assert item._dump(partial=False) == item.model_dump()
+    assert ItemSchema.model_construct()._dump(partial=True) == {}
+
+
+@pytest.mark.asyncio
+async def test_constructed_schema_with_missing_fields_dumps_like_model_dump():
+    class NestedItem(Schema):
+        item: ItemSchema
+        note: str | None = None
+
+    item = ItemSchema.model_construct()
+    assert item._dump(partial=False) == item.model_dump() == {}
+    await item.validate()
+    assert item.validated == {}
+
+    nested = NestedItem.model_construct(item=ItemSchema.model_construct())
+    assert nested._dump(partial=False) == nested.model_dump()
+
+    class PlainSchema(Schema):
+        name: str
+
+    plain = PlainSchema.model_construct()
+    await plain.validate()
+    assert plain.validated == {}
+
+
+@pytest.mark.asyncio
+async def test_partial_validation_skips_rules_for_unset_roots():
+    recorder = RecordingRule()
+
+    class ContactSchema(Schema):
+        email: str
+        phone: str | None = None
+
+        class Meta:
+            rules = {"$.phone": recorder}
+
+    assert ContactSchema.__fv_rule_roots__ == frozenset({"phone"})
+
+    contact = ContactSchema(email="a@b.c")
+    await contact.validate(partial=True)
+    assert recorder.seen == []
+    assert contact.validated == {"email": "a@b.c"}
+
+    contact = ContactSchema(email="a@b.c", phone="123")
+    await contact.validate(partial=True)
+    assert recorder.seen == [("phone",)]
+
+
+def test_path_trie_matches_per_path_resolution():
+    data = {"items": [{"price": 1, "qty": 2}, {"qty": 3}], "total": 4}
+    path_exprs = ["$.items[*].price", "$.total", "$.items[*].qty", "$.items", "$"]
+    trie = PathTrie(path_exprs)
+    assert trie.shares_prefix
+    assert trie.resolve(data) == [compile_path(path_expr)(data) for path_expr in path_exprs]
+    assert not PathTrie(["$.a", "$.b.c"]).shares_prefix
+
+
+@pytest.mark.asyncio
+async def test_rules_sharing_a_prefix_report_errors_in_rule_order():
+    class Line(Schema):
+        items: list[dict[str, int]]
+
+        class Meta:
+            rules = {
+                "$.items[*].qty": SyncMustEqual(1),
+                "$.items[*].price": SyncMustEqual(10),
+            }
+
+    assert Line.__fv_rule_trie__ is not None
+    line = Line(items=[{"price": 5, "qty": 1}, {"price": 10, "qty": 2}])
+    with pytest.raises(ValidationRuleException) as exc:
+        await line.validate()
+    assert [error["loc"] for error in exc.value.errors] == [
+        ("items", "1", "qty"),
+        ("items", "0", "price"),
+    ]
+
+
+def test_meta_rules_are_frozen_at_class_creation():
+    class OneShot(Schema):
+        value: int
+
+        class Meta:
+            rules = (Schema.Rule("$.value", [SyncMustEqual(1)]) for _ in range(1))
+
+    assert isinstance(OneShot.__fv_rules__, tuple) and len(OneShot.__fv_rules__) == 1
+    for _ in range(2):
+        with pytest.raises(ValidationRuleException):
+            OneShot(value=2).validate_sync()
+
+    with pytest.raises(TypeError):
+
+        class BadRules(Schema):
+            value: int
+
+            class Meta:
+                rules = {"$.value": "not-a-validator"}
+
+
+def test_rules_and_rule_exceptions_use_slots_and_pickle():
+    rule = Schema.Rule("$.items[*].x", [SyncMustEqual(1)])
+    assert not hasattr(rule, "__dict__")
+    restored_rule = pickle.loads(pickle.dumps(rule))
+    assert restored_rule.path == rule.path
+    assert restored_rule._resolver({"items": [{"x": 1}]}) == [(("items", "0", "x"), 1)]
+
+    exc = ValidationRuleException(
+        "bad",
+        loc=("x",),
+        error_type="value_error.bad",
+        errors=[{"loc": ("x",), "msg": "bad", "type": "value_error.bad"}],
+    )
+    restored = pickle.loads(pickle.dumps(exc))
+    assert (restored.message, restored.loc, restored.error_type, restored.errors) == (
+        exc.message,
+        exc.loc,
+        exc.error_type,
+        exc.errors,
+    )
+
+
+def test_extra_fields_are_kept_in_the_dump():
+    class OpenSchema(Schema):
+        model_config = ConfigDict(extra="allow")
+        value: int
+
+    schema = OpenSchema(value=1, other=2)
+    assert OpenSchema.__fv_dump_plan__ is None
+    assert schema._dump(partial=False) == {"value": 1, "other": 2}
+
+
+@pytest.mark.asyncio
+async def test_partial_validation_without_reachable_rules_snapshots_validated():
+    class PairSchema(Schema):
+        a: int | None = None
+        b: int | None = None
+
+        class Meta:
+            rules = [Schema.Rule("$.a", [SyncMustEqual(1)])]
+
+    schema = PairSchema(b=1)
+    await schema.validate(partial=True)
+    schema.a = -5
+    assert schema.validated == {"b": 1}
+
+
+@pytest.mark.asyncio
+async def test_partial_validation_runs_rules_on_computed_fields():
+    class OrderSchema(Schema):
+        price: int = 0
+        qty: int = 0
+
+        @computed_field
+        @property
+        def total(self) -> int:
+            return self.price * self.qty
+
+        class Meta:
+            rules = [Schema.Rule("$.total", [SyncMustEqual(1)])]
+
+    assert OrderSchema.__fv_rule_roots__ is None
+    with pytest.raises(ValidationRuleException) as exc:
+        await OrderSchema(price=2).validate(partial=True)
+    assert exc.value.errors[0]["loc"] == ("total",)
+
+
+def test_rule_like_entries_are_wrapped_as_rules():
+    RuleTuple = namedtuple("RuleTuple", "path validators")
+
+    class TupleRules(Schema):
+        value: int
+
+        class Meta:
+            rules = [RuleTuple("$.value", (SyncMustEqual(1),))]
+
+    assert all(isinstance(rule, Schema.Rule) for rule in TupleRules.__fv_rules__)
+    TupleRules(value=1).validate_sync()
+    with pytest.raises(ValidationRuleException):
+        TupleRules(value=2).validate_sync()
+
+    with pytest.raises(TypeError):
+
+        class BadEntries(Schema):
+            value: int
+
+            class Meta:
+                rules = ["$.value"]